@@ -20,7 +20,7 @@ benchmarking PennyLane's auxiliary functionality outside direct circuit evaluati
 import inspect
 import logging
 from dataclasses import replace
-from functools import singledispatch
+from functools import lru_cache, singledispatch
 from numbers import Number
 from typing import Callable, Sequence, Tuple, Union
 
@@ -57,6 +57,15 @@ QuantumTape_or_Batch = Union[QuantumTape, QuantumTapeBatch]
 # always a function from a resultbatch to either a result or a result batch
 PostprocessingFn = Callable[[ResultBatch], Result_or_ResultBatch]
 
+# All-zero results are only cached for interfaces whose arrays can be shared safely: arrays
+# created while tracing (JAX, TensorFlow) cannot outlive the trace, and Torch tensors can be
+# modified in place by users.
+_UNCACHED_INTERFACES = ("jax", "tensorflow", "torch")
+
+# Results with more elements than this are never cached, so that the module-level caches do
+# not pin large arrays (e.g. the state of many wires) in memory for the life of the process.
+_MAX_CACHED_SIZE = 2**16
+
 
 @singledispatch
 def zero_measurement(
@@ -71,21 +80,51 @@ def _zero_measurement(mp, obj_with_wires, shots, batch_size, interface):
     if all(isinstance(s, int) for s in shape):
         if batch_size is not None:
             shape = (batch_size,) + shape
-        return math.zeros(shape, like=interface, dtype=mp.numeric_type)
+        return _zeros(shape, interface, mp.numeric_type)
     if batch_size is not None:
         shape = ((batch_size,) + s for s in shape)
-    return tuple(math.zeros(s, like=interface, dtype=mp.numeric_type) for s in shape)
+    return tuple(_zeros(s, interface, mp.numeric_type) for s in shape)
+
+
+def _zeros(shape, like, dtype):
+    """Create an all-zero array, reusing a cached one if it is small and can be shared safely."""
+    if like in _UNCACHED_INTERFACES or np.prod(shape) > _MAX_CACHED_SIZE:
+        # without a dtype, the interface's default floating point type is used
+        if dtype is None:
+            return math.zeros(shape, like=like)
+        return math.zeros(shape, like=like, dtype=dtype)
+    return _cached_zero_return(shape, like, dtype)
+
+
+@lru_cache(maxsize=128)
+def _cached_zero_return(shape, like, dtype):
+    """Create an all-zero array that is shared by all executions requesting the same
+    ``shape``, interface and ``dtype``. NumPy arrays are returned as read-only."""
+    result = math.zeros(shape, like=like, dtype=dtype)
+    if isinstance(result, np.ndarray):
+        result.flags.writeable = False
+    return result
+
+
+def _zero_derivative(result, interface):
+    """Create an all-zero derivative with the same shape and dtype as ``result``."""
+    if not isinstance(result, np.ndarray):
+        return math.zeros_like(result)
+    return _zeros(result.shape, interface, result.dtype)
 
 
 @zero_measurement.register
 def _(mp: ClassicalShadowMP, obj_with_wires, shots, batch_size, interface):
-    shapes = [mp.shape(obj_with_wires, Shots(s)) for s in shots]
+    if shots.has_partitioned_shots:
+        shapes = [mp.shape(obj_with_wires, Shots(s)) for s in shots]
+    else:
+        shapes = [mp.shape(obj_with_wires, shots)]
     if batch_size is not None:
         # shapes = [(batch_size,) + shape for shape in shapes]
         raise ValueError(
             "Parameter broadcasting is not supported with null.qubit and qml.classical_shadow"
         )
-    results = tuple(math.zeros(shape, like=interface, dtype=np.int8) for shape in shapes)
+    results = tuple(_zeros(shape, interface, np.int8) for shape in shapes)
     return results if shots.has_partitioned_shots else results[0]
 
 
@@ -97,36 +136,99 @@ def _(mp: CountsMP, obj_with_wires, shots, batch_size, interface):
         state = "0" * num_wires
         results = tuple({state: math.asarray(s, like=interface)} for s in shots)
         if mp.all_outcomes:
-            outcomes = [f"{x:0{num_wires}b}" for x in range(1, 2**num_wires)]
+            outcomes = (
+                _basis_state_outcomes(num_wires)
+                if 2**num_wires > _MAX_CACHED_SIZE
+                else _cached_basis_state_outcomes(num_wires)
+            )[1:]
     else:
-        outcomes = sorted(mp.eigvals())  # always assign shots to the smallest
-        results = tuple({outcomes[0]: math.asarray(s, like=interface)} for s in shots)
-        outcomes = outcomes[1:] if mp.all_outcomes else []
+        # always assign shots to the smallest eigenvalue
+        if mp.all_outcomes:
+            outcomes = list(np.unique(mp.eigvals()))
+            smallest, outcomes = outcomes[0], outcomes[1:]
+        else:
+            smallest = np.min(mp.eigvals())
+        results = tuple({smallest: math.asarray(s, like=interface)} for s in shots)
 
     if outcomes:
-        zero = math.asarray(0, like=interface)
+        zeros = dict.fromkeys(outcomes, math.asarray(0, like=interface))
         for res in results:
-            for val in outcomes:
-                res[val] = zero
+            res.update(zeros)
     if batch_size is not None:
         results = tuple([r] * batch_size for r in results)
     return results[0] if len(results) == 1 else results
 
 
+def _basis_state_outcomes(num_wires):
+    """All computational basis states of ``num_wires`` wires as bitstrings, in ascending order."""
+    return tuple(f"{x:0{num_wires}b}" for x in range(2**num_wires))
+
+
+_cached_basis_state_outcomes = lru_cache(maxsize=16)(_basis_state_outcomes)
+
+
 zero_measurement.register(DensityMatrixMP)(_zero_measurement)
 
 
 @zero_measurement.register(StateMP)
 @zero_measurement.register(ProbabilityMP)
 def _(mp: Union[StateMP, ProbabilityMP], obj_with_wires, shots, batch_size, interface):
-    wires = mp.wires or obj_with_wires.wires
-    state = [1.0] + [0.0] * (2 ** len(wires) - 1)
-    if batch_size is not None:
-        state = [state] * batch_size
-    result = math.asarray(state, like=interface)
+    num_wires = len(mp.wires or obj_with_wires.wires)
+    size = 2**num_wires * (batch_size or 1)
+    if interface in _UNCACHED_INTERFACES or size > _MAX_CACHED_SIZE:
+        result = _zero_basis_state(num_wires, batch_size, interface)
+    else:
+        result = _cached_zero_basis_state(num_wires, batch_size, interface)
     return (result,) * shots.num_copies if shots.has_partitioned_shots else result
 
 
+def _zero_basis_state(num_wires, batch_size, like, broadcast=False):
+    """Create the (optionally batched) state vector or probabilities of the all-zero basis state.
+    If ``broadcast=True``, batches are returned as a read-only broadcast view of a single state."""
+    state = np.zeros(2**num_wires)
+    state[0] = 1.0
+    if batch_size is not None:
+        if broadcast:
+            state = np.broadcast_to(state, (batch_size, state.size))
+        else:
+            state = np.tile(state, (batch_size, 1))
+    return math.asarray(state, like=like)
+
+
+@lru_cache(maxsize=32)
+def _cached_zero_basis_state(num_wires, batch_size, like):
+    """Cached version of ``_zero_basis_state``. NumPy arrays are returned as read-only."""
+    # cached results are only created for NumPy and Autograd, which can wrap the read-only
+    # broadcast view without a copy
+    result = _zero_basis_state(num_wires, batch_size, like, broadcast=True)
+    if isinstance(result, np.ndarray):
+        result.flags.writeable = False
+    return result
+
+
+def _copy_dicts(result):
+    """Shallow copy the mutable counts dictionaries of a result, sharing all arrays."""
+    if isinstance(result, dict):
+        return dict(result)
+    if isinstance(result, (tuple, list)):
+        return type(result)(_copy_dicts(r) for r in result)
+    return result
+
+
+@lru_cache
+def _accept_without_decomposition(stopping_condition):
+    """Extend a decomposition stopping condition to also accept operators without a decomposition.
+
+    The wrapped conditions are cached so that repeated calls to :meth:`NullQubit.preprocess`
+    build equal transform programs without redefining the stopping conditions.
+    """
+
+    def new_stopping_condition(op):
+        return (not op.has_decomposition) or stopping_condition(op)
+
+    return new_stopping_condition
+
+
 @simulator_tracking
 @single_tape_support
 class NullQubit(Device):
@@ -240,14 +342,37 @@ class NullQubit(Device):
             return tuple(zip(*results))
         return results
 
+    def _simulate_batch(self, circuits, interface):
+        # Torch tensors can be modified in place, so they are never shared between circuits
+        if interface == "torch":
+            return tuple(self._simulate(c, interface) for c in circuits)
+
+        # circuits sharing their measurement processes, shots, batch size and wires have the
+        # same all-zero results, so each such structure is only simulated once per batch
+        cache = {}
+        results = []
+        for c in circuits:
+            key = (
+                tuple(id(mp) for mp in c.measurements),
+                c.shots,
+                c.batch_size,
+                None if self.wires else c.wires,
+            )
+            if key in cache:
+                results.append(_copy_dicts(cache[key]))
+            else:
+                results.append(cache.setdefault(key, self._simulate(c, interface)))
+        return tuple(results)
+
     def _derivatives(self, circuit, interface):
         shots = circuit.shots
         obj_with_wires = self if self.wires else circuit
         n = len(circuit.trainable_params)
         derivatives = tuple(
             (
-                math.zeros_like(
-                    zero_measurement(mp, obj_with_wires, shots, circuit.batch_size, interface)
+                _zero_derivative(
+                    zero_measurement(mp, obj_with_wires, shots, circuit.batch_size, interface),
+                    interface,
                 ),
             )
             * n
@@ -262,7 +387,7 @@ class NullQubit(Device):
         batch_size = circuit.batch_size
         n = len(circuit.trainable_params)
         res_shape = (n,) if batch_size is None else (n, batch_size)
-        return math.zeros(res_shape, like=interface)
+        return _zeros(res_shape, interface, None)
 
     @staticmethod
     def _jvp(circuit, interface):
@@ -279,27 +404,21 @@ class NullQubit(Device):
         """No-op property to allow for borrowing DefaultQubit.preprocess without AttributeErrors"""
         return None
 
-    # pylint: disable=cell-var-from-loop
     def preprocess(
         self, execution_config=DefaultExecutionConfig
     ) -> Tuple[TransformProgram, ExecutionConfig]:
         program, _ = DefaultQubit.preprocess(self, execution_config)
         for t in program:
             if t.transform == decompose.transform:
-                original_stopping_condition = t.kwargs["stopping_condition"]
-
-                def new_stopping_condition(op):
-                    return (not op.has_decomposition) or original_stopping_condition(op)
-
-                t.kwargs["stopping_condition"] = new_stopping_condition
+                t.kwargs["stopping_condition"] = _accept_without_decomposition(
+                    t.kwargs["stopping_condition"]
+                )
 
                 original_shots_stopping_condition = t.kwargs.get("stopping_condition_shots", None)
                 if original_shots_stopping_condition:
-
-                    def new_shots_stopping_condition(op):
-                        return (not op.has_decomposition) or original_shots_stopping_condition(op)
-
-                    t.kwargs["stopping_condition_shots"] = new_shots_stopping_condition
+                    t.kwargs["stopping_condition_shots"] = _accept_without_decomposition(
+                        original_shots_stopping_condition
+                    )
 
         updated_values = {}
         if execution_config.gradient_method in ["best", "adjoint"]:
@@ -333,9 +452,7 @@ class NullQubit(Device):
                 ),
             )
 
-        return tuple(
-            self._simulate(c, INTERFACE_TO_LIKE[execution_config.interface]) for c in circuits
-        )
+        return self._simulate_batch(circuits, INTERFACE_TO_LIKE[execution_config.interface])
 
     def supports_derivatives(self, execution_config=None, circuit=None):
         return execution_config is None or execution_config.gradient_method in (
@@ -363,21 +480,17 @@ class NullQubit(Device):
         circuits: QuantumTape_or_Batch,
         execution_config: ExecutionConfig = DefaultExecutionConfig,
     ):
-        return tuple(
-            self._derivatives(c, INTERFACE_TO_LIKE[execution_config.interface]) for c in circuits
-        )
+        interface = INTERFACE_TO_LIKE[execution_config.interface]
+        return tuple(self._derivatives(c, interface) for c in circuits)
 
     def execute_and_compute_derivatives(
         self,
         circuits: QuantumTape_or_Batch,
         execution_config: ExecutionConfig = DefaultExecutionConfig,
     ):
-        results = tuple(
-            self._simulate(c, INTERFACE_TO_LIKE[execution_config.interface]) for c in circuits
-        )
-        jacs = tuple(
-            self._derivatives(c, INTERFACE_TO_LIKE[execution_config.interface]) for c in circuits
-        )
+        interface = INTERFACE_TO_LIKE[execution_config.interface]
+        results = self._simulate_batch(circuits, interface)
+        jacs = tuple(self._derivatives(c, interface) for c in circuits)
 
         return results, jacs
 
@@ -387,7 +500,8 @@ class NullQubit(Device):
         tangents: Tuple[Number],
         execution_config: ExecutionConfig = DefaultExecutionConfig,
     ):
-        return tuple(self._jvp(c, INTERFACE_TO_LIKE[execution_config.interface]) for c in circuits)
+        interface = INTERFACE_TO_LIKE[execution_config.interface]
+        return tuple(self._jvp(c, interface) for c in circuits)
 
     def execute_and_compute_jvp(
         self,
@@ -395,10 +509,9 @@ class NullQubit(Device):
         tangents: Tuple[Number],
         execution_config: ExecutionConfig = DefaultExecutionConfig,
     ):
-        results = tuple(
-            self._simulate(c, INTERFACE_TO_LIKE[execution_config.interface]) for c in circuits
-        )
-        jvps = tuple(self._jvp(c, INTERFACE_TO_LIKE[execution_config.interface]) for c in circuits)
+        interface = INTERFACE_TO_LIKE[execution_config.interface]
+        results = self._simulate_batch(circuits, interface)
+        jvps = tuple(self._jvp(c, interface) for c in circuits)
 
         return results, jvps
 
@@ -408,7 +521,8 @@ class NullQubit(Device):
         cotangents: Tuple[Number],
         execution_config: ExecutionConfig = DefaultExecutionConfig,
     ):
-        return tuple(self._vjp(c, INTERFACE_TO_LIKE[execution_config.interface]) for c in circuits)
+        interface = INTERFACE_TO_LIKE[execution_config.interface]
+        return tuple(self._vjp(c, interface) for c in circuits)
 
     def execute_and_compute_vjp(
         self,
@@ -416,8 +530,7 @@ class NullQubit(Device):
         cotangents: Tuple[Number],
         execution_config: ExecutionConfig = DefaultExecutionConfig,
     ):
-        results = tuple(
-            self._simulate(c, INTERFACE_TO_LIKE[execution_config.interface]) for c in circuits
-        )
-        vjps = tuple(self._vjp(c, INTERFACE_TO_LIKE[execution_config.interface]) for c in circuits)
+        interface = INTERFACE_TO_LIKE[execution_config.interface]
+        results = self._simulate_batch(circuits, interface)
+        vjps = tuple(self._vjp(c, interface) for c in circuits)
         return results, vjps
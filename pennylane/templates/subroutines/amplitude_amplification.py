@@ -18,6 +18,7 @@ This submodule contains the template for Amplitude Amplification.
 
 # pylint: disable-msg=too-many-arguments
 import copy
+from functools import lru_cache
 
 import numpy as np
 
@@ -26,21 +27,27 @@ from pennylane.operation import Operation
 from pennylane.wires import Wires
 
 
+@lru_cache
 def _get_fixed_point_angles(iters, p_min):
     """
     Returns the angles needed for the fixed-point amplitude amplification algorithm.
     The angles are computed using equation (11) of `arXiv:1409.3305v2 <https://arxiv.org/abs/1409.3305>`__.
+
+    The result is cached, so the returned arrays are read-only.
     """
 
     delta = np.sqrt(1 - p_min)
-    gamma = np.cos(np.arccos(1 / delta, dtype=np.complex128) / iters, dtype=np.complex128) ** -1
+    # 1 / delta >= 1, so the Chebyshev term cos(arccos(1 / delta) / iters) is evaluated with its
+    # real-valued hyperbolic form
+    gamma = 1 / np.cosh(np.arccosh(1 / delta) / iters)
+
+    j = np.arange(1, iters // 2 + 1)
+    alphas = 2 * np.arctan(1 / (np.tan(2 * np.pi * j / iters) * np.sqrt(1 - gamma**2)))
+    betas = -alphas[::-1]
 
-    alphas = [
-        2 * np.arctan(1 / (np.tan(2 * np.pi * j / iters) * np.sqrt(1 - gamma**2)))
-        for j in range(1, iters // 2 + 1)
-    ]
-    betas = [-alphas[-j] for j in range(1, iters // 2 + 1)]
-    return alphas[: iters // 2], betas[: iters // 2]
+    alphas.flags.writeable = False
+    betas.flags.writeable = False
+    return alphas, betas
 
 
 class AmplitudeAmplification(Operation):
@@ -157,41 +164,68 @@ class AmplitudeAmplification(Operation):
         reflection_wires = kwargs["reflection_wires"]
 
         ops = []
+        recording = qml.QueuingManager.recording()
+
+        def _reuse(op):
+            # queuing contexts only hold unique objects, so repeated operators are re-applied
+            return qml.apply(op) if recording else op
 
         if fixed_point:
-            alphas, betas = _get_fixed_point_angles(iters, p_min)
+            alphas, betas = _get_fixed_point_angles(int(iters), float(p_min))
+            ctrl_O = None
 
             for iter in range(iters // 2):
                 ops.append(qml.Hadamard(wires=work_wire))
-                ops.append(qml.ctrl(O, control=work_wire))
+                if ctrl_O is None:
+                    ctrl_O = qml.ctrl(O, control=work_wire)
+                    ops.append(ctrl_O)
+                else:
+                    ops.append(_reuse(ctrl_O))
                 ops.append(qml.Hadamard(wires=work_wire))
                 ops.append(qml.PhaseShift(betas[iter], wires=work_wire))
                 ops.append(qml.Hadamard(wires=work_wire))
-                ops.append(qml.ctrl(O, control=work_wire))
+                ops.append(_reuse(ctrl_O))
                 ops.append(qml.Hadamard(wires=work_wire))
 
                 ops.append(qml.Reflection(U, -alphas[iter], reflection_wires=reflection_wires))
         else:
+            reflection = None
+
             for _ in range(iters):
-                ops.append(O)
-                if qml.QueuingManager.recording():
-                    qml.apply(O)
-                ops.append(qml.Reflection(U, np.pi, reflection_wires=reflection_wires))
+                ops.append(_reuse(O))
+                if reflection is None:
+                    reflection = qml.Reflection(U, np.pi, reflection_wires=reflection_wires)
+                    ops.append(reflection)
+                else:
+                    ops.append(_reuse(reflection))
 
         return ops
 
     def map_wires(self, wire_map: dict):
         # pylint: disable=protected-access
-        new_op = copy.deepcopy(self)
-        new_op._wires = Wires([wire_map.get(wire, wire) for wire in self.wires])
-        new_op._hyperparameters["U"] = new_op._hyperparameters["U"].map_wires(wire_map)
-        new_op._hyperparameters["O"] = new_op._hyperparameters["O"].map_wires(wire_map)
-        new_op._hyperparameters["reflection_wires"] = Wires(
-            [wire_map.get(wire, wire) for wire in new_op._hyperparameters["reflection_wires"]]
-        )
-        new_op._hyperparameters["work_wire"] = wire_map.get(
-            w := new_op._hyperparameters["work_wire"], w
-        )
+        get_wire = wire_map.get
+        U = self._hyperparameters["U"]
+        new_U = U.map_wires(wire_map)
+        reflection_wires = self._hyperparameters["reflection_wires"]
+
+        new_op = copy.copy(self)
+        new_op._hyperparameters = dict(self._hyperparameters)
+        new_op._hyperparameters["U"] = new_U
+        new_op._hyperparameters["O"] = self._hyperparameters["O"].map_wires(wire_map)
+        new_op._hyperparameters["work_wire"] = get_wire(w := self._hyperparameters["work_wire"], w)
+
+        # the reflection wires and the operator wires usually coincide with the wires of U,
+        # which have already been mapped and validated
+        if reflection_wires == U.wires:
+            new_op._hyperparameters["reflection_wires"] = new_U.wires
+        else:
+            new_op._hyperparameters["reflection_wires"] = Wires(
+                [get_wire(wire, wire) for wire in reflection_wires]
+            )
+        if self.wires == U.wires:
+            new_op._wires = new_U.wires
+        else:
+            new_op._wires = Wires([get_wire(wire, wire) for wire in self.wires])
         return new_op
 
     def queue(self, context=qml.QueuingManager):
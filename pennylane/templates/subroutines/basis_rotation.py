@@ -15,6 +15,8 @@
 This module contains the template for performing basis transformation defined by a set of fermionic ladder operators.
 """
 
+from functools import lru_cache
+
 import numpy as np
 
 import pennylane as qml
@@ -22,6 +24,58 @@ from pennylane.operation import AnyWires, Operation
 from pennylane.qchem.givens_decomposition import givens_decomposition
 
 
+# Matrices with more elements than this are not cached, as the cache entries hold the matrix
+# and its O(N^2) Givens rotations for the life of the process.
+_MAX_CACHED_SIZE = 2**12
+
+
+@lru_cache(maxsize=32)
+def _cached_givens_decomposition(data, shape, dtype):
+    """Givens decomposition of the NumPy matrix stored in ``data``, cached on its contents."""
+    return givens_decomposition(np.frombuffer(data, dtype=dtype).reshape(shape))
+
+
+def _givens_decomposition(unitary_matrix):
+    """Givens decomposition of ``unitary_matrix``, reusing previous results for small NumPy
+    matrices."""
+    if (
+        qml.math.get_interface(unitary_matrix) == "numpy"
+        and np.size(unitary_matrix) <= _MAX_CACHED_SIZE
+    ):
+        unitary_matrix = np.ascontiguousarray(unitary_matrix)
+        return _cached_givens_decomposition(
+            unitary_matrix.tobytes(), unitary_matrix.shape, unitary_matrix.dtype.str
+        )
+    return givens_decomposition(unitary_matrix)
+
+
+@lru_cache(maxsize=8)
+def _unitarity_probe(dim):
+    """Fixed, normalized random complex vector used to probe unitarity."""
+    rng = np.random.default_rng(seed=42)
+    probe = rng.standard_normal(dim) + 1j * rng.standard_normal(dim)
+    probe /= np.linalg.norm(probe)
+    probe.flags.writeable = False
+    return probe
+
+
+def _is_unitary(unitary_matrix, atol, strict=False):
+    r"""Check whether ``unitary_matrix`` is unitary.
+
+    By default, the check verifies that all columns are normalized and that :math:`U U^\dagger`
+    leaves a fixed random vector unchanged, which costs :math:`\mathcal{O}(N^2)` operations.
+    If ``strict=True``, the full product :math:`U U^\dagger` is compared with the identity instead.
+    """
+    umat = qml.math.toarray(unitary_matrix)
+    if strict:
+        return np.allclose(umat @ umat.conj().T, np.eye(len(umat)), atol=atol)
+
+    if not np.allclose(np.sum(np.abs(umat) ** 2, axis=0), 1.0, atol=atol):
+        return False
+    probe = _unitarity_probe(len(umat))
+    return np.allclose(umat @ (umat.conj().T @ probe), probe, atol=atol)
+
+
 # pylint: disable-msg=too-many-arguments
 class BasisRotation(Operation):
     r"""Implement a circuit that provides a unitary that can be used to do an exact single-body basis rotation.
@@ -40,7 +94,9 @@ class BasisRotation(Operation):
     Args:
         wires (Iterable[Any]): wires that the operator acts on
         unitary_matrix (array): matrix specifying the basis transformation
-        check (bool): test unitarity of the provided `unitary_matrix`
+        check (bool or str): test unitarity of the provided `unitary_matrix`. If ``True``,
+            a fast check based on the column norms and a random probe vector is used. Use
+            ``"strict"`` to compare the full product :math:`u u^\dagger` with the identity.
 
     Raises:
         ValueError: if the provided matrix is not square.
@@ -117,8 +173,7 @@ class BasisRotation(Operation):
             )
 
         if check:
-            umat = qml.math.toarray(unitary_matrix)
-            if not np.allclose(umat @ umat.conj().T, np.eye(M, dtype=complex), atol=1e-6):
+            if not _is_unitary(unitary_matrix, atol=1e-6, strict=check == "strict"):
                 raise ValueError("The provided transformation matrix should be unitary.")
 
         if len(wires) < 2:
@@ -147,7 +202,8 @@ class BasisRotation(Operation):
         Args:
             wires (Any or Iterable[Any]): wires that the operator acts on
             unitary_matrix (array): matrix specifying the basis transformation
-            check (bool): test unitarity of the provided `unitary_matrix`
+            check (bool or str): test unitarity of the provided `unitary_matrix`, using the full
+                product :math:`u u^\dagger` if ``check="strict"``
 
         Returns:
             list[.Operator]: decomposition of the operator
@@ -160,28 +216,34 @@ class BasisRotation(Operation):
             )
 
         if check:
-            umat = qml.math.toarray(unitary_matrix)
-            if not np.allclose(umat @ umat.conj().T, np.eye(M, dtype=complex), atol=1e-4):
+            if not _is_unitary(unitary_matrix, atol=1e-4, strict=check == "strict"):
                 raise ValueError("The provided transformation matrix should be unitary.")
 
         if len(wires) < 2:
             raise ValueError(f"This template requires at least two wires, got {len(wires)}")
 
-        op_list = []
-        phase_list, givens_list = givens_decomposition(unitary_matrix)
+        phase_list, givens_list = _givens_decomposition(unitary_matrix)
 
-        for idx, phase in enumerate(phase_list):
-            op_list.append(qml.PhaseShift(np.angle(phase), wires=wires[idx]))
+        angles = np.angle(phase_list)
+        op_list = [
+            qml.PhaseShift(angles[idx], wires=wires[idx])
+            for idx in np.flatnonzero(~np.isclose(angles, 0.0)).tolist()
+        ]
 
-        for grot_mat, indices in givens_list:
-            theta = np.arccos(np.real(grot_mat[1, 1]))
-            phi = np.angle(grot_mat[0, 0])
+        # only the diagonal entries of the Givens matrices are needed to extract the angles
+        n_givens = len(givens_list)
+        diags = np.fromiter((g[1, 1].real for g, _ in givens_list), dtype=float, count=n_givens)
+        offs = np.fromiter((g[0, 0] for g, _ in givens_list), dtype=complex, count=n_givens)
+        thetas = 2 * np.arccos(diags)
+        phis = np.angle(offs)
+        nonzero_phis = ~np.isclose(phis, 0.0)
 
+        for (_, indices), theta, phi, nonzero in zip(givens_list, thetas, phis, nonzero_phis):
             op_list.append(
-                qml.SingleExcitation(2 * theta, wires=[wires[indices[0]], wires[indices[1]]])
+                qml.SingleExcitation(theta, wires=[wires[indices[0]], wires[indices[1]]])
             )
 
-            if not np.isclose(phi, 0.0):
+            if nonzero:
                 op_list.append(qml.PhaseShift(phi, wires=wires[indices[0]]))
 
         return op_list
@@ -16,6 +16,7 @@ Contains the k-UpCCGSD template.
 """
 # pylint: disable-msg=too-many-branches,too-many-arguments,protected-access
 import copy
+from functools import lru_cache
 
 import numpy as np
 
@@ -24,6 +25,28 @@ from pennylane.operation import AnyWires, Operation
 from pennylane.wires import Wires
 
 
+@lru_cache(maxsize=64)
+def _generalized_singles_indices(n_wires, delta_sz):
+    """Index pairs ``(r, p)`` of the generalized single excitations on ``n_wires`` wires."""
+    # twice the spin projection of the alpha-beta electrons, so that it can be compared exactly
+    two_sz = np.empty(n_wires, dtype=int)
+    two_sz[0::2] = 1
+    two_sz[1::2] = -1
+
+    # select all pairs (r, p) with sz[p] - sz[r] == delta_sz and p != r, in row-major order
+    mask = (two_sz[None, :] - two_sz[:, None] == 2 * delta_sz) & ~np.eye(n_wires, dtype=bool)
+    rs, ps = np.nonzero(mask)
+
+    return tuple(zip(rs.tolist(), ps.tolist()))
+
+
+@lru_cache(maxsize=64)
+def _generalized_pair_doubles_indices(n_wires):
+    """Index pairs ``(r, p)`` of the spatial orbitals involved in the pair double excitations."""
+    n_pairs = n_wires // 2
+    return tuple((r, p) for r in range(n_pairs) for p in range(n_pairs) if p != r)
+
+
 def generalized_singles(wires, delta_sz):
     r"""Return generalized single excitation terms
 
@@ -31,18 +54,10 @@ def generalized_singles(wires, delta_sz):
         \hat{T_1} = \sum_{pq} t_{p}^{q} \hat{c}^{\dagger}_{q} \hat{c}_{p}
 
     """
-    sz = np.array(
-        [0.5 if (i % 2 == 0) else -0.5 for i in range(len(wires))]
-    )  # alpha-beta electrons
-    gen_singles_wires = []
-    for r in range(len(wires)):
-        for p in range(len(wires)):
-            if sz[p] - sz[r] == delta_sz and p != r:
-                if r < p:
-                    gen_singles_wires.append(wires[r : p + 1])
-                else:
-                    gen_singles_wires.append(wires[p : r + 1][::-1])
-    return gen_singles_wires
+    return [
+        tuple(wires[r : p + 1]) if r < p else tuple(reversed(wires[p : r + 1]))
+        for r, p in _generalized_singles_indices(len(wires), delta_sz)
+    ]
 
 
 def generalized_pair_doubles(wires):
@@ -53,16 +68,11 @@ def generalized_pair_doubles(wires):
                \hat{c}^{\dagger}_{q_\alpha} \hat{c}^{\dagger}_{q_\beta} \hat{c}_{p_\beta} \hat{c}_{p_\alpha}
 
     """
-    pair_gen_doubles_wires = [
-        [
-            wires[r : r + 2],
-            wires[p : p + 2],
-        ]  # wires for [wires[r], wires[r+1], wires[p], wires[p+1]] terms
-        for r in range(0, len(wires) - 1, 2)
-        for p in range(0, len(wires) - 1, 2)
-        if p != r  # remove redundant terms
-    ]
-    return pair_gen_doubles_wires
+    # wires of each spatial orbital, i.e. [wires[r], wires[r+1]] for even r
+    pairs = [tuple(wires[r : r + 2]) for r in range(0, len(wires) - 1, 2)]
+
+    # wires for [wires[r], wires[r+1], wires[p], wires[p+1]] terms
+    return [(pairs[r], pairs[p]) for r, p in _generalized_pair_doubles_indices(len(wires))]
 
 
 class kUpCCGSD(Operation):
@@ -216,10 +226,11 @@ class kUpCCGSD(Operation):
         return self.data, (self.wires, hyperparameters)
 
     def __init__(self, weights, wires, k=1, delta_sz=0, init_state=None, id=None):
-        if len(wires) < 4:
-            raise ValueError(f"Requires at least four wires; got {len(wires)} wires.")
-        if len(wires) % 2:
-            raise ValueError(f"Requires even number of wires; got {len(wires)} wires.")
+        n_wires = len(wires)
+        if n_wires < 4:
+            raise ValueError(f"Requires at least four wires; got {n_wires} wires.")
+        if n_wires % 2:
+            raise ValueError(f"Requires even number of wires; got {n_wires} wires.")
 
         if k < 1:
             raise ValueError(f"Requires k to be at least 1; got {k}.")
@@ -227,24 +238,23 @@ class kUpCCGSD(Operation):
         if delta_sz not in [-1, 0, 1]:
             raise ValueError(f"Requires delta_sz to be one of ±1 or 0; got {delta_sz}.")
 
-        s_wires = generalized_singles(list(wires), delta_sz)
-        d_wires = generalized_pair_doubles(list(wires))
-
+        # validate the weights before building the excitation wires
+        expected_shape = self.shape(k, n_wires, delta_sz)
         shape = qml.math.shape(weights)
-        if shape != (
-            k,
-            len(s_wires) + len(d_wires),
-        ):
-            raise ValueError(
-                f"Weights tensor must be of shape {(k, len(s_wires) + len(d_wires),)}; got {shape}."
-            )
+        if shape != expected_shape:
+            raise ValueError(f"Weights tensor must be of shape {expected_shape}; got {shape}.")
+
+        wires_list = list(wires)
+        s_wires = generalized_singles(wires_list, delta_sz)
+        d_wires = generalized_pair_doubles(wires_list)
 
-        init_state = qml.math.toarray(init_state)
+        if not isinstance(init_state, np.ndarray):
+            init_state = qml.math.toarray(init_state)
         if init_state.dtype != np.dtype("int"):
             raise ValueError(f"Elements of 'init_state' must be integers; got {init_state.dtype}")
 
         self._hyperparameters = {
-            "init_state": tuple(init_state),
+            "init_state": tuple(init_state.tolist()),
             "s_wires": s_wires,
             "d_wires": d_wires,
             "k": k,
@@ -253,13 +263,18 @@ class kUpCCGSD(Operation):
         super().__init__(weights, wires=wires, id=id)
 
     def map_wires(self, wire_map: dict):
-        new_op = copy.deepcopy(self)
-        new_op._wires = Wires([wire_map.get(wire, wire) for wire in self.wires])
+        def mapper(wire):
+            return wire_map.get(wire, wire)
+
+        # a shallow copy avoids copying the (potentially large) weights tensor
+        new_op = copy.copy(self)
+        new_op._hyperparameters = dict(self._hyperparameters)
+        new_op._wires = Wires(list(map(mapper, self.wires)))
         new_op._hyperparameters["s_wires"] = [
-            [wire_map.get(w, w) for w in wires] for wires in self._hyperparameters["s_wires"]
+            tuple(map(mapper, wires)) for wires in self._hyperparameters["s_wires"]
         ]
         new_op._hyperparameters["d_wires"] = [
-            [[wire_map.get(w, w) for w in _wires] for _wires in wires]
+            tuple(tuple(map(mapper, _wires)) for _wires in wires)
             for wires in self._hyperparameters["d_wires"]
         ]
         return new_op
@@ -298,20 +313,22 @@ class kUpCCGSD(Operation):
         Returns:
             list[.Operator]: decomposition of the operator
         """
-        op_list = []
-
-        op_list.append(qml.BasisEmbedding(init_state, wires=wires))
+        op_list = [qml.BasisEmbedding(init_state, wires=wires)]
 
+        n_singles = len(s_wires)
         for layer in range(k):
-            for i, (w1, w2) in enumerate(d_wires):
-                op_list.append(
-                    qml.FermionicDoubleExcitation(
-                        weights[layer][len(s_wires) + i], wires1=w1, wires2=w2
-                    )
-                )
+            # slice the weights once per layer, so that each gate only needs a single index
+            layer_weights = weights[layer]
+            doubles_weights = layer_weights[n_singles:]
 
-            for j, s_wires_ in enumerate(s_wires):
-                op_list.append(qml.FermionicSingleExcitation(weights[layer][j], wires=s_wires_))
+            op_list.extend(
+                qml.FermionicDoubleExcitation(doubles_weights[i], wires1=w1, wires2=w2)
+                for i, (w1, w2) in enumerate(d_wires)
+            )
+            op_list.extend(
+                qml.FermionicSingleExcitation(layer_weights[j], wires=s_wires_)
+                for j, s_wires_ in enumerate(s_wires)
+            )
 
         return op_list
 
@@ -338,7 +355,7 @@ class kUpCCGSD(Operation):
                 f"This template requires an even number of qubits; got 'n_wires' = {n_wires}"
             )
 
-        s_wires = generalized_singles(range(n_wires), delta_sz)
-        d_wires = generalized_pair_doubles(range(n_wires))
+        n_singles = len(_generalized_singles_indices(n_wires, delta_sz))
+        n_doubles = len(_generalized_pair_doubles_indices(n_wires))
 
-        return k, len(s_wires) + len(d_wires)
+        return k, n_singles + n_doubles
@@ -85,6 +85,18 @@ def test_supports_operator_without_decomp(shots):
     assert dev.tracker.latest["resources"].gate_types["MyOp"] == 1
 
 
+@pytest.mark.parametrize("gradient_method", (None, "adjoint"))
+def test_preprocess_is_deterministic(gradient_method):
+    """Test that repeated calls to preprocess produce equal transform programs."""
+    dev = NullQubit()
+    config = ExecutionConfig(gradient_method=gradient_method)
+
+    program1, _ = dev.preprocess(config)
+    program2, _ = dev.preprocess(config)
+
+    assert program1 == program2
+
+
 def test_tracking():
     """Test some tracking values for null.qubit"""
 
@@ -442,6 +454,73 @@ class TestSampleMeasurements:
         assert np.array_equal(res1, np.zeros((100, 2)))
         assert np.array_equal(res2, np.zeros(50))
 
+    def test_zero_results_are_cached(self):
+        """Test that repeated executions share the same read-only zero results."""
+        qs = qml.tape.QuantumScript([qml.RX(0.5, wires=0)], [qml.sample(wires=(0, 1))], shots=10)
+
+        dev = NullQubit()
+        res1 = dev.execute(qs)
+        res2 = dev.execute(qs)
+
+        assert res1 is res2
+        assert not res1.flags.writeable
+
+    @pytest.mark.parametrize(
+        "mp, shots",
+        [(qml.state(), None), (qml.probs(), None), (qml.sample(wires=(0, 1)), 40000)],
+    )
+    @pytest.mark.parametrize("x", [0.5, np.array([0.1, 0.2])])
+    def test_large_results_are_not_cached(self, mp, shots, x):
+        """Test that results with many elements are created anew for every execution, as
+        regular writeable arrays."""
+        qs = qml.tape.QuantumScript([qml.RX(x, wires=w) for w in range(17)], [mp], shots=shots)
+
+        dev = NullQubit()
+        res1 = dev.execute(qs)
+        res2 = dev.execute(qs)
+
+        assert res1 is not res2
+        assert res1.flags.writeable
+        assert 0 not in res1.strides
+        assert qml.math.allclose(res1, res2)
+
+    @pytest.mark.torch
+    @pytest.mark.parametrize("mp", [qml.sample(wires=(0, 1)), qml.probs(wires=(0, 1))])
+    def test_torch_results_are_not_shared(self, mp):
+        """Test that Torch results are not shared between executions, as they can be modified
+        in place."""
+        qs = qml.tape.QuantumScript([qml.RX(0.5, wires=0)], [mp], shots=10)
+        config = ExecutionConfig(interface="torch")
+
+        dev = NullQubit()
+        res1 = dev.execute(qs, config)
+        res1.add_(1)
+        res2 = dev.execute(qs, config)
+
+        assert res1 is not res2
+        assert qml.math.get_interface(res2) == "torch"
+        assert qml.math.allclose(res2, dev.execute(qs))
+
+    def test_batch_with_shared_measurements(self):
+        """Test that tapes sharing their measurements are only simulated once per batch."""
+        mps = [qml.counts(wires=(0, 1), all_outcomes=True), qml.probs(wires=0)]
+        qs1 = qml.tape.QuantumScript([qml.RX(0.1, wires=0)], mps, shots=100)
+        qs2 = qml.tape.QuantumScript([qml.RX(0.2, wires=0)], mps, shots=100)
+        qs3 = qml.tape.QuantumScript([qml.RX(0.2, wires=0)], mps, shots=50)
+
+        dev = NullQubit()
+        res1, res2, res3 = dev.execute((qs1, qs2, qs3))
+
+        assert res1[1] is res2[1]
+        assert res3 is not res1
+        assert res1[0] == {"00": 100, "01": 0, "10": 0, "11": 0}
+        assert res3[0] == {"00": 50, "01": 0, "10": 0, "11": 0}
+
+        # the counts dictionaries are mutable and must not be shared between tapes
+        assert res2[0] is not res1[0]
+        res1[0]["00"] = 0
+        assert res2[0] == {"00": 100, "01": 0, "10": 0, "11": 0}
+
     @pytest.mark.parametrize("all_outcomes", [True, False])
     def test_counts_wires(self, all_outcomes):
         """Test that a Counts measurement with wires works as expected"""
@@ -490,6 +569,17 @@ class TestSampleMeasurements:
         result = dev.execute(qs)
         assert result == ({-1: 10000, 1: 0} if all_outcomes else {-1: 10000})
 
+    @pytest.mark.parametrize("all_outcomes", [False, True])
+    def test_counts_obs_degenerate_eigvals(self, all_outcomes):
+        """Test that shots are assigned to the smallest eigenvalue when eigenvalues repeat."""
+        qs = qml.tape.QuantumScript(
+            [], [qml.counts(qml.PauliZ(0) @ qml.PauliZ(1), all_outcomes=all_outcomes)], shots=100
+        )
+
+        dev = NullQubit()
+        result = dev.execute(qs)
+        assert result == ({-1: 100, 1: 0} if all_outcomes else {-1: 100})
+
     @pytest.mark.parametrize("all_outcomes", [False, True])
     def test_counts_obs_batched(self, all_outcomes):
         """Test that a Counts measurement with an observable and batching works as expected"""
@@ -769,6 +859,21 @@ class TestDeviceDifferentiation:
         assert actual_val == 0
         assert actual_grad == 0
 
+    def test_derivatives_are_cached(self):
+        """Tests that zero derivatives are shared between measurements with the same shape."""
+        dev = NullQubit()
+        x = np.array([0.1, 0.2])
+        qs = qml.tape.QuantumScript(
+            [qml.RX(x[0], 0), qml.RY(x[1], 1)],
+            [qml.probs(wires=0), qml.probs(wires=1)],
+            trainable_params=[0, 1],
+        )
+
+        (jac0, jac1) = dev.compute_derivatives(qs, self.ec)
+        assert jac0[0] is jac0[1] is jac1[0]
+        assert np.array_equal(jac0[0], np.zeros(2))
+        assert not jac0[0].flags.writeable
+
     def test_derivatives_list_with_single_circuit(self):
         """Tests a basic example with a batch containing a single circuit."""
         dev = NullQubit()
@@ -71,6 +71,38 @@ class TestInitialization:
         op = qml.AmplitudeAmplification(U, O, iters=3, fixed_point=False)
         qml.ops.functions.assert_valid(op)
 
+    def test_array_p_min(self):
+        """Test that the fixed-point decomposition accepts an array-valued ``p_min``."""
+        U = generator(wires=range(3))
+        O = oracle([0, 2], wires=range(3))
+        kwargs = {"iters": 3, "fixed_point": True, "work_wire": 3}
+
+        decomp = qml.AmplitudeAmplification(U, O, p_min=np.array(0.7), **kwargs).decomposition()
+        expected = qml.AmplitudeAmplification(U, O, p_min=0.7, **kwargs).decomposition()
+
+        assert len(decomp) == len(expected)
+        for op1, op2 in zip(decomp, expected):
+            qml.assert_equal(op1, op2)
+
+    def test_map_wires_does_not_modify_original(self):
+        """Test that map_wires returns a new operator and leaves the original untouched."""
+        U = generator(wires=range(3))
+        O = oracle([0, 2], wires=range(3))
+        op = qml.AmplitudeAmplification(U, O, iters=3, fixed_point=True, work_wire=3)
+
+        wire_map = {0: "a", 1: 1, 2: 2, 3: "b"}
+        new_op = op.map_wires(wire_map)
+
+        assert new_op.wires == op.wires.map(wire_map)
+        assert new_op.hyperparameters["U"].wires == U.wires.map(wire_map)
+        assert new_op.hyperparameters["reflection_wires"] == U.wires.map(wire_map)
+        assert new_op.hyperparameters["work_wire"] == "b"
+
+        assert op.wires == U.wires + qml.wires.Wires(3)
+        assert op.hyperparameters["U"] is U
+        assert op.hyperparameters["reflection_wires"] == U.wires
+        assert op.hyperparameters["work_wire"] == 3
+
 
 @pytest.mark.parametrize(
     "n_wires, items, iters",
@@ -17,8 +17,10 @@ Tests for the BasisRotation template.
 
 import numpy as np
 import pytest
+from scipy.stats import unitary_group
 
 import pennylane as qml
+from pennylane.templates.subroutines.basis_rotation import _cached_givens_decomposition
 
 
 @pytest.mark.xfail  # to be fixed by shortcut story 49160
@@ -95,6 +97,47 @@ class TestDecomposition:
             assert np.allclose(op.parameters[0], gate_angles[idx])  # gate parameter
             assert list(op.wires) == gate_wires[idx]  # gate wires
 
+    def test_large_givens_decomposition_is_not_cached(self):
+        """Test that the Givens decomposition of large matrices is not kept in the cache."""
+        unitary_matrix = unitary_group.rvs(65, random_state=3)
+        currsize = _cached_givens_decomposition.cache_info().currsize
+
+        qml.BasisRotation.compute_decomposition(wires=range(65), unitary_matrix=unitary_matrix)
+
+        assert _cached_givens_decomposition.cache_info().currsize == currsize
+
+    def test_zero_phases_are_skipped(self):
+        """Test that no PhaseShift is emitted for diagonal phases equal to one."""
+        unitary_matrix = np.diag([1.0, -1.0, 1.0]).astype(complex)
+        decomp = qml.BasisRotation.compute_decomposition(
+            wires=range(3), unitary_matrix=unitary_matrix
+        )
+
+        phase_shifts = [op for op in decomp if isinstance(op, qml.PhaseShift)]
+        assert len(phase_shifts) == 1
+        assert phase_shifts[0].wires == qml.wires.Wires(1)
+        assert np.allclose(phase_shifts[0].parameters[0], np.pi)
+
+    def test_givens_decomposition_is_cached(self):
+        """Test that the Givens decomposition of a NumPy matrix is reused across decompositions."""
+        unitary_matrix = np.array(
+            [
+                [-0.77228482 + 0.0j, -0.02959195 + 0.63458685j],
+                [0.63527644 + 0.0j, -0.03597397 + 0.77144651j],
+            ]
+        )
+        op = qml.BasisRotation(wires=range(2), unitary_matrix=unitary_matrix)
+
+        decomp = op.decomposition()
+        hits = _cached_givens_decomposition.cache_info().hits
+        new_decomp = qml.BasisRotation.compute_decomposition(
+            wires=range(2), unitary_matrix=unitary_matrix.copy()
+        )
+
+        assert _cached_givens_decomposition.cache_info().hits == hits + 1
+        for op1, op2 in zip(decomp, new_decomp):
+            qml.assert_equal(op1, op2)
+
     def test_custom_wire_labels(self, tol):
         """Test that BasisRotation template can deal with non-numeric, nonconsecutive wire labels."""
 
@@ -319,6 +362,34 @@ class TestInputs:
                 wires=wires, unitary_matrix=unitary_matrix, check=True
             )
 
+    @pytest.mark.parametrize("check", [True, "strict"])
+    def test_non_unitary_with_normalized_columns(self, check):
+        """Test that a non-unitary matrix with normalized columns is rejected by both the fast
+        and the strict unitarity checks."""
+        umat = np.array([[1.0, 1.0], [0.0, 1.0]]) / np.array([1.0, np.sqrt(2)])
+
+        with pytest.raises(ValueError, match="should be unitary"):
+            qml.BasisRotation(wires=range(2), unitary_matrix=umat, check=check)
+
+        with pytest.raises(ValueError, match="should be unitary"):
+            qml.BasisRotation.compute_decomposition(
+                wires=range(2), unitary_matrix=umat, check=check
+            )
+
+    @pytest.mark.parametrize("check", [True, "strict"])
+    @pytest.mark.parametrize(
+        "umat",
+        [
+            unitary_group.rvs(4, random_state=7),
+            np.array([[0, 1, 0, 0], [1, 0, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0]]),
+        ],
+    )
+    def test_unitary_passes_check(self, check, umat):
+        """Test that unitary matrices, including integer ones, pass both the fast and the strict
+        unitarity checks."""
+        op = qml.BasisRotation(wires=range(4), unitary_matrix=umat, check=check)
+        assert len(op.decomposition()) > 0
+
     def test_id(self):
         """Test that the id attribute can be set."""
         template = qml.BasisRotation(
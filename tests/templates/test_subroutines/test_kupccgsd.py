@@ -14,12 +14,15 @@
 """
 Tests for the k-UpCCGSD template.
 """
+import copy
+
 import numpy as np
 
 # pylint: disable=too-many-arguments,too-few-public-methods
 import pytest
 
 import pennylane as qml
+from pennylane.templates.subroutines.kupccgsd import _generalized_singles_indices
 
 k_delta_sz_init_state_wires = [
     (1, 0, qml.math.array([1, 1, 0, 0]), qml.math.array([0, 1, 2, 3])),
@@ -123,6 +126,14 @@ class TestDecomposition:
         for wires1, wires2 in zip(exp_wires, res_wires):
             assert np.all(wires1 == wires2)
 
+    @pytest.mark.parametrize(
+        "weights", [np.zeros((1, 6)), qml.numpy.zeros((1, 6), requires_grad=False)]
+    )
+    def test_zero_weights_keep_all_gates(self, weights):
+        """Test that the gate structure of the decomposition does not depend on the weight values."""
+        op = qml.kUpCCGSD(weights, wires=range(4), k=1, delta_sz=0, init_state=[1, 1, 0, 0])
+        assert len(op.decomposition()) == 7
+
     def test_custom_wire_labels(self, tol):
         """Test that template can deal with non-numeric, nonconsecutive wire labels."""
 
@@ -344,8 +355,10 @@ class TestDecomposition:
             op.hyperparameters["d_wires"],
         )
 
-        assert gen_singles_wires == generalized_singles_wires
-        assert gen_doubles_wires == generalized_pair_doubles_wires
+        assert gen_singles_wires == [tuple(w) for w in generalized_singles_wires]
+        assert gen_doubles_wires == [
+            tuple(tuple(w) for w in pair) for pair in generalized_pair_doubles_wires
+        ]
 
 
 class TestInputs:
@@ -444,6 +457,32 @@ class TestInputs:
         )
         assert template.id == "a"
 
+    def test_map_wires_does_not_modify_original(self):
+        """Test that map_wires maps all excitation wires without modifying the original operator."""
+        op = qml.kUpCCGSD(
+            qml.math.array([[0.55, 0.72, 0.6, 0.54, 0.42, 0.65]]),
+            wires=range(4),
+            k=1,
+            delta_sz=0,
+            init_state=qml.math.array([1, 1, 0, 0]),
+        )
+        s_wires = copy.deepcopy(op.hyperparameters["s_wires"])
+        d_wires = copy.deepcopy(op.hyperparameters["d_wires"])
+        wire_map = {0: "a", 1: "b", 2: "c", 3: "d"}
+
+        new_op = op.map_wires(wire_map)
+
+        assert new_op.wires == qml.wires.Wires(["a", "b", "c", "d"])
+        assert new_op.hyperparameters["s_wires"] == [
+            tuple(wire_map[w] for w in wires) for wires in s_wires
+        ]
+        assert new_op.hyperparameters["d_wires"] == [
+            tuple(tuple(wire_map[w] for w in _wires) for _wires in wires) for wires in d_wires
+        ]
+        assert op.wires == qml.wires.Wires(range(4))
+        assert op.hyperparameters["s_wires"] == s_wires
+        assert op.hyperparameters["d_wires"] == d_wires
+
 
 class TestAttributes:
     """Test additional methods and attributes"""
@@ -465,6 +504,14 @@ class TestAttributes:
         shape = qml.kUpCCGSD.shape(k, n_wires, delta_sz)
         assert shape == expected_shape
 
+    def test_excitation_indices_are_cached(self):
+        """Test that the excitation indices are computed once per number of wires."""
+        qml.kUpCCGSD.shape(k=1, n_wires=6, delta_sz=0)
+        hits = _generalized_singles_indices.cache_info().hits
+        qml.kUpCCGSD.shape(k=2, n_wires=6, delta_sz=0)
+
+        assert _generalized_singles_indices.cache_info().hits == hits + 1
+
     def test_shape_exception_not_enough_qubits(self):
         """Test that the shape function warns if there are not enough qubits."""
 